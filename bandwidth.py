@@ -1,38 +1,163 @@
+import threading
 import time
 from collections import deque
+from typing import List, Tuple, Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(nogil=True, cache=True)
+def _push_samples(samples: np.ndarray, head: int, tail: int, count: int, total: int, window_ns: int,
+                  batch: np.ndarray) -> Tuple[int, int, int, int]:
+    """
+    Append a time ordered batch of (timestamp, bytes) pairs to the ring buffer and evict
+    samples older than the window. Returns the updated (head, tail, count, total).
+    """
+    capacity = samples.shape[0]
+    for i in range(batch.shape[0]):
+        current_time = batch[i, 0]
+        received_bytes = batch[i, 1]
+
+        # Ring buffer is full, drop the oldest sample to make room
+        if count == capacity:
+            total -= samples[head, 1]
+            head = (head + 1) % capacity
+            count -= 1
+
+        samples[tail, 0] = current_time
+        samples[tail, 1] = received_bytes
+        tail = (tail + 1) % capacity
+        count += 1
+        total += received_bytes
+
+        while count > 0 and current_time - samples[head, 0] > window_ns:
+            total -= samples[head, 1]
+            head = (head + 1) % capacity
+            count -= 1
+
+    return head, tail, count, total
 
 
 class BandwidthMonitor:
     """
     A class to monitor the bandwidth of a data using a moving median window.
+
+    Producers register received bytes into a per-thread pending batch without
+    any locking. The single consumer (the thread calling `get_bandwidth` and
+    `reset`) drains those batches into the ring buffer and publishes a small
+    snapshot of the window, which `get_bandwidth` reads without touching the
+    ring buffer.
+
     Attributes:
         window_size (int): The size of the moving median window in seconds.
-        _bytes_received (deque): A deque to store the number of bytes received.
-        _timestamps (deque): A deque to store the timestamps of received bytes.
+        _capacity (int): The number of samples the ring buffer can hold.
+        _window_ns (int): The size of the window in nanoseconds.
+        _samples (np.ndarray): A preallocated ring buffer of (monotonic timestamp in ns, bytes) pairs.
+        _head (int): The index of the oldest sample in the ring buffer.
+        _tail (int): The index where the next sample will be written.
+        _count (int): The number of samples currently in the ring buffer.
+        _total (int): The running sum of bytes currently inside the window.
+        _local (threading.local): Holds the pending batch of the calling producer thread.
+        _pending_batches (List[deque]): Pending batches of all producer threads.
+        _snapshot (Tuple[int, int, int]): The (total bytes, first timestamp, last timestamp) of the window.
+        register_received_bytes (Callable[[int], None]): Registers bytes received by the calling thread.
     """
 
-    def __init__(self, window_size: int = 60) -> None:
+    def __init__(self, window_size: int = 60, max_rate: int = 60) -> None:
         self._window_size = window_size
-        self._bytes_received = deque()
-        self._timestamps = deque()
+        self._window_ns = window_size * 1_000_000_000
+
+        # Expected maximum of registrations per second, doubled for headroom
+        self._capacity = window_size * max_rate * 2
+        self._samples = np.zeros((self._capacity, 2), dtype=np.int64)
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._total = 0
+        self._snapshot: Tuple[int, int, int] = (0, 0, 0)
+
+        self._local = threading.local()
+        self._pending_batches: List[deque] = []
+
+        # Built per instance, see _specialize_register_received_bytes
+        self.register_received_bytes: Callable[[int], None] = self._specialize_register_received_bytes()
 
     def reset(self):
-        self._bytes_received.clear()
-        self._timestamps.clear()
+        # Discard samples which were not integrated yet
+        for pending in self._pending_batches:
+            pending.clear()
+
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._total = 0
+        self._snapshot = (0, 0, 0)
+
+    def _specialize_register_received_bytes(self) -> Callable[[int], None]:
+        """
+        Build `register_received_bytes` with everything it touches bound as closure
+        variables, which saves the attribute and global lookups on every call.
+        """
+        local = self._local
+        create_pending_batch = self._create_pending_batch
+        monotonic_ns = time.monotonic_ns
+
+        def register_received_bytes(received_bytes: int) -> None:
+            try:
+                pending = local.pending
+            except AttributeError:
+                pending = create_pending_batch()
+            pending.append((monotonic_ns(), received_bytes))
 
-    def register_received_bytes(self, received_bytes: int) -> None:
-        current_time = time.time()
-        self._bytes_received.append(received_bytes)
-        self._timestamps.append(current_time)
+        return register_received_bytes
 
-        while len(self._timestamps) > 0 and current_time - self._timestamps[0] > self._window_size:
-            self._timestamps.popleft()
-            self._bytes_received.popleft()
+    def _create_pending_batch(self) -> deque:
+        # First registration from the calling thread, list.append is atomic
+        pending = self._local.pending = deque()
+        self._pending_batches.append(pending)
+        return pending
+
+    def _drain_pending_batches(self) -> None:
+        samples = []
+        for pending in self._pending_batches:
+            # Only the consumer pops, so the deque cannot shrink under our feet
+            while pending:
+                samples.append(pending.popleft())
+
+        if not samples:
+            return
+
+        # Merge batches of different threads in time order
+        samples.sort()
+        self._head, self._tail, self._count, self._total = _push_samples(
+            self._samples, self._head, self._tail, self._count, self._total, self._window_ns,
+            np.array(samples, dtype=np.int64)
+        )
+
+        # Tuple assignment is atomic, readers never see a half updated window
+        if self._count > 0:
+            first_timestamp = self._samples[self._head, 0]
+            last_timestamp = self._samples[(self._tail - 1) % self._capacity, 0]
+            self._snapshot = (int(self._total), int(first_timestamp), int(last_timestamp))
+        else:
+            self._snapshot = (0, 0, 0)
 
     def get_bandwidth(self) -> int:
-        elapsed_time = self._timestamps[-1] - self._timestamps[0] if len(self._timestamps) > 1 else 1
-        total_bytes_received = sum(self._bytes_received)
-        return int(total_bytes_received / elapsed_time)
+        self._drain_pending_batches()
+
+        total, first_timestamp, last_timestamp = self._snapshot
+        elapsed_time = (last_timestamp - first_timestamp) / 1e9 if last_timestamp > first_timestamp else 1
+        return int(total / elapsed_time)
 
     def get_bandwidth_str(self):
         return BandwidthFormatter.format(self.get_bandwidth())
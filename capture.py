@@ -4,11 +4,14 @@ from typing import Optional, Any, Dict, Union
 import mss
 
 from fps import FrameRateLimiter
+from lock import LatestSlot
+from thread import Task
 
 
 class AbstractCaptureStrategy(ABC):
     @abstractmethod
     def capture_screen(self) -> bytes:
+        """Capture the screen and return its pixels in BGRA order."""
         pass
 
     @abstractmethod
@@ -19,42 +22,93 @@ class AbstractCaptureStrategy(ABC):
     def get_monitor_height(self) -> int:
         pass
 
+    def start(self) -> None:
+        """Start background work of the strategy, if there is any."""
+        pass
+
+    def stop(self) -> None:
+        """Stop background work of the strategy, if there is any."""
+        pass
 
-class MSSCaptureStrategy(AbstractCaptureStrategy):
+
+class MSSCaptureStrategy(Task, AbstractCaptureStrategy):
     """
     A screen capture strategy that uses the MSS library to capture the screen of the first
-    monitor.
+    monitor. When width or height are given and smaller than the monitor, only the top left
+    region of that size is captured.
+
+    The screen is grabbed by a background thread paced to the requested fps, so grabbing
+    the next frame overlaps with encoding and sending of the previous one. The
+    `capture_screen` method hands out the most recent screenshot.
 
     Attributes:
-        _sct (mss.mss): The MSS object used for screen capturing.
+        _width (Optional[int]): The requested capture width, full monitor width if None.
+        _height (Optional[int]): The requested capture height, full monitor height if None.
+        _region (Dict[str, int]): The region of the first monitor to capture.
+        _frame_timeout (float): The maximum time in seconds to wait for a new screenshot.
+        _latest_frame (LatestSlot[bytes]): Hands the most recent screenshot in BGRA order to the consumer.
     """
 
-    def __init__(self, fps: int):
+    def __init__(self,
+                 fps: int,
+                 width: Optional[int] = None,
+                 height: Optional[int] = None,
+                 frame_timeout: float = 1.0):
+        super().__init__()
         self._frame_rate_limiter = FrameRateLimiter(fps)
-        self._sct = mss.mss()
+        self._width = width
+        self._height = height
+
+        # Resolve the capture region once, the MSS object is not needed afterwards
+        with mss.mss() as sct:
+            self._region = self._get_capture_region(sct.monitors[1])
+        self._frame_timeout = frame_timeout
+        self._latest_frame: LatestSlot[bytes] = LatestSlot()
+
+    def __str__(self):
+        return f"MSSCaptureStrategy()"
 
     def get_monitor_width(self) -> int:
-        return self._sct.monitors[1].get("width")
+        return self._region.get("width")
 
     def get_monitor_height(self) -> int:
-        return self._sct.monitors[1].get("height")
+        return self._region.get("height")
+
+    def _get_capture_region(self, monitor: Dict[str, int]) -> Dict[str, int]:
+        """
+        Return the region of the monitor to capture, the requested width and height
+        are limited to the size of the monitor.
+        """
+        return {
+            "left": monitor.get("left"),
+            "top": monitor.get("top"),
+            "width": min(self._width or monitor.get("width"), monitor.get("width")),
+            "height": min(self._height or monitor.get("height"), monitor.get("height")),
+        }
+
+    def run(self):
+        # MSS objects must not be shared between threads, the grabbing thread owns its own
+        with mss.mss() as sct:
+            region = self._region
+            grab = sct.grab
+
+            while self.running.getv():
+                # sleep for the required time to match fps
+                self._frame_rate_limiter.tick()
+
+                # Capture the screen
+                try:
+                    screen_shot = grab(region)
+                except mss.exception.ScreenShotError as e:
+                    print(e)
+                    continue
+
+                # Hand out raw BGRA pixels, the encoder converts them to RGB
+                self._latest_frame.put(screen_shot.raw)
 
     def capture_screen(self) -> Union[None, bytes]:
-        # sleep for the required time to match fps
-        # self._frame_rate_limiter.tick()
-
-        # Get the dimensions of the first monitor
-        monitor = self._sct.monitors[1]
-
-        # Capture the screen
-        try:
-            screen_shot = self._sct.grab(monitor)
-        except mss.exception.ScreenShotError as e:
-            print(e)
-            return None
-
-        # Convert the resized image to a bytes and return
-        return screen_shot.rgb
+        # Wait until the grabbing thread provides a new screenshot
+        return self._latest_frame.get(self._frame_timeout)
 
 
 class CaptureStrategyBuilder:
@@ -68,6 +122,8 @@ class CaptureStrategyBuilder:
         builder = CaptureStrategyBuilder()
         capture_strategy = (builder.set_strategy_type("mss")
                                   .set_option("fps", 30)
+                                  .set_option("width", 1280)
+                                  .set_option("height", 720)
                                   .build())
     """
 
@@ -89,7 +145,9 @@ class CaptureStrategyBuilder:
 
         if self._strategy_type.lower() == "mss":
             fps = self._options.get("fps", 30)
-            return MSSCaptureStrategy(fps)
+            width = self._options.get("width")
+            height = self._options.get("height")
+            return MSSCaptureStrategy(fps, width, height)
 
         # Add other strategy types here
         raise NotImplementedError
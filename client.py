@@ -1,10 +1,11 @@
 import os
+import threading
 
 import pygame
-from pygame import QUIT
+from pygame import QUIT, VIDEOEXPOSE
 
 from connection import AutoReconnectClient
-from lock import AutoLockingValue
+from fps import FrameRateLimiter
 from pipeline import CaptureEncodeSendPipeline
 from pread import SocketDataReader
 from processor import PacketProcessor, CommandProcessor
@@ -25,7 +26,7 @@ class Client:
         _width (int): The width of the pygame window.
         _height (int): The height of the pygame window.
         _fps (int): The desired frame rate for capturing and displaying the video.
-        _running (AutoLockingValue): A boolean flag to indicate if the client is running.
+        _running (threading.Event): An event which is set while the client is running.
         _connection (AutoReconnectClient): The connection object for the client.
         _socket_reader (SocketDataReader): The socket data reader object.
         _socket_writer (SocketDataWriter): The socket data writer object.
@@ -44,7 +45,7 @@ class Client:
         self._height = height
 
         self._fps = fps
-        self._running = False
+        self._running = threading.Event()
 
         self._connection = AutoReconnectClient(host, port)
         self._socket_reader = SocketDataReader(self._connection)
@@ -54,9 +55,9 @@ class Client:
         self._pipeline = CaptureEncodeSendPipeline(fps, self._socket_writer)
 
     def run(self):
-        if self._running:
+        if self._running.is_set():
             raise RuntimeError("The 'run' method can only be called once")
-        self._running = True
+        self._running.set()
         self._connection.start()
         self._packet_processor.start()
         self._pipeline.start()
@@ -65,22 +66,28 @@ class Client:
         pygame.init()
         screen = pygame.display.set_mode((self._width, self._height))
         pygame.display.set_caption(self._title)
-        clock = pygame.time.Clock()
+        frame_rate_limiter = FrameRateLimiter(self._fps)
 
-        while self._running:
+        # Window content never changes, draw it only once
+        screen.fill((0, 0, 0))
+        pygame.display.flip()
+
+        while self._running.is_set():
             for event in pygame.event.get():
                 if event.type == QUIT:
                     self.stop()
                     break
+                elif event.type == VIDEOEXPOSE:
+                    # Window was uncovered, present the unchanged content again
+                    pygame.display.flip()
 
-            screen.fill((0, 0, 0))
-            pygame.display.flip()
-            clock.tick(self._fps)
+            # Sleep instead of letting SDL busy-wait, leaves the CPU to the pipeline threads
+            frame_rate_limiter.tick()
 
-    pygame.quit()
+        pygame.quit()
 
     def stop(self):
-        self._running = False
+        self._running.clear()
         self._connection.stop()
         self._command_executor.stop()
         self._packet_processor.stop()
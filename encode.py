@@ -14,6 +14,7 @@ class AbstractEncoderStrategy(ABC):
 
     @abstractmethod
     def encode_frame(self, width: int, height: int, frame: bytes):
+        """Encode a frame given as BGRA pixels."""
         pass
 
 
@@ -34,8 +35,9 @@ class DefaultEncoder:
         return f"DefaultEncoder(fps={self._fps})"
 
     def encode_frame(self, width: int, height: int, frame: bytes) -> bytes:
+        # Captured frames are BGRA, the stream carries RGB
         nframe = np.frombuffer(frame, dtype=np.uint8)
-        nframe = cv2.UMat(nframe.reshape((width, height, 3)))
+        nframe = cv2.cvtColor(cv2.UMat(nframe.reshape((width, height, 4))), cv2.COLOR_BGRA2RGB)
 
         try:
             if self._last_frame is None or self._frame_count % self._fps == 0:
@@ -1,5 +1,5 @@
-from threading import Lock
-from typing import TypeVar, Generic
+from threading import Lock, Event
+from typing import TypeVar, Generic, Optional
 
 T = TypeVar("T")
 
@@ -58,3 +58,43 @@ class AutoLockingValue(Generic[T]):
         else:
             with self._lock:
                 setattr(self._value, name, value)
+
+
+class LatestSlot(Generic[T]):
+    """
+    A single-slot handoff of values from one producer thread to one consumer thread.
+
+    Only the most recent value is kept: a put overwrites a value which has not been
+    taken yet, so the producer never blocks and a slow consumer always gets the
+    newest value instead of a backlog. This suits live streams such as screen frames.
+
+    Example usage:
+
+        slot = LatestSlot()
+
+        # Producer thread
+        slot.put(frame)
+
+        # Consumer thread, waits up to one second for a new value
+        frame = slot.get(timeout=1)
+
+    Attributes:
+        _value: The most recent value.
+        _event: A threading.Event which is set while a value has not been taken yet.
+    """
+
+    __slots__ = ("_value", "_event")
+
+    def __init__(self):
+        self._value: Optional[T] = None
+        self._event: Event = Event()
+
+    def put(self, value: T) -> None:
+        self._value = value
+        self._event.set()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        if not self._event.wait(timeout):
+            return None
+        self._event.clear()
+        return self._value
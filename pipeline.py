@@ -39,18 +39,32 @@ class _CaptureComponent(Component):
             container for the current capture strategy.
         _sync_event (threading.Event): A synchronization event to control when
             to capture the screen.
+        _started (bool): Whether the background work of the capture strategy was started.
     """
 
     def __init__(self, capture_strategy: AbstractCaptureStrategy, ):
         super().__init__()
         self._capture_strategy = capture_strategy
+        self._started = False
 
     def __str__(self):
         return f"CaptureComponent()"
 
     def set_capture_strategy(self, capture_strategy: AbstractCaptureStrategy):
+        # Hand over background work of a running component to the new strategy
+        if self._started:
+            self._capture_strategy.stop()
+            capture_strategy.start()
         self._capture_strategy = capture_strategy
 
+    def start(self):
+        self._started = True
+        self._capture_strategy.start()
+
+    def stop(self):
+        self._started = False
+        self._capture_strategy.stop()
+
     def run(self, *args):
         return self._capture_strategy.capture_screen()
 
@@ -228,6 +242,14 @@ class CaptureEncodeSendPipeline(AbstractPipeline):
             socket_writer
         )
 
+    def start(self):
+        self._capture_component.start()
+        super().start()
+
+    def stop(self):
+        super().stop()
+        self._capture_component.stop()
+
     def get_capture_component(self):
         return self._capture_component
 
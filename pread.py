@@ -1,7 +1,9 @@
 import io
 import struct
-from typing import Tuple
+import time
+from typing import Tuple, Optional
 
+from bandwidth import BandwidthMonitor
 from connection import Connection
 from dao import MouseMoveData, AbstractDataObject, VideoData, MouseClickData, KeyboardData
 from enums import PacketType, ButtonState, MouseButton
@@ -44,11 +46,21 @@ class BytesReader:
 
 
 class SocketDataReader(BytesReader):
-    def __init__(self, connection: Connection, buffer_size: int = 256):
+    def __init__(self,
+                 connection: Connection,
+                 buffer_size: int = 256,
+                 bandwidth_monitor: Optional[BandwidthMonitor] = None,
+                 bandwidth_flush_interval: float = 0.05):
         super().__init__(b"")  # Initialize BytesReader with empty bytes
         self._buffer_size = buffer_size
         self._connection = connection
 
+        # Received bytes are reported to the bandwidth monitor in batches
+        self._bandwidth_monitor = bandwidth_monitor
+        self._bandwidth_flush_interval = bandwidth_flush_interval
+        self._pending_received_bytes = 0
+        self._last_bandwidth_flush = time.monotonic()
+
     def read_int(self) -> int:
         self._ensure_data(4)
         return super().read_int()
@@ -96,12 +108,37 @@ class SocketDataReader(BytesReader):
         Raises a ConnectionError if the connection is closed.
         """
         data = self._connection.read(self._buffer_size)
+        self._register_received_bytes(len(data))
 
         current_pos = self.buffer.tell()
         self.buffer.seek(0, io.SEEK_END)
         self.buffer.write(data)
         self.buffer.seek(current_pos)
 
+    def reset_received_bytes(self) -> None:
+        """
+        Discards received bytes which were not reported to the bandwidth monitor yet.
+        Should be called together with resetting the monitor, e.g. when the connection
+        is lost, so bytes from before the reset are not reported afterwards.
+        """
+        self._pending_received_bytes = 0
+        self._last_bandwidth_flush = time.monotonic()
+
+    def _register_received_bytes(self, received_bytes: int) -> None:
+        """
+        Accumulates received bytes and reports them to the bandwidth monitor at most
+        once per flush interval.
+        """
+        if self._bandwidth_monitor is None:
+            return
+
+        self._pending_received_bytes += received_bytes
+        current_time = time.monotonic()
+        if current_time - self._last_bandwidth_flush > self._bandwidth_flush_interval:
+            self._bandwidth_monitor.register_received_bytes(self._pending_received_bytes)
+            self._pending_received_bytes = 0
+            self._last_bandwidth_flush = current_time
+
     def _seek_to_end_of_sync_packet(self) -> bool:
         """
         Searches for the synchronization packet bytes in the buffer and seeks
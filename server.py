@@ -38,7 +38,6 @@ class Server:
         _socket_reader (SocketDataReader): The socket data reader object.
         _socket_writer (SocketDataWriter): The socket data writer object.
         _bandwidth_monitor (BandwidthMonitor): A bandwidth monitor object to track bandwidth usage.
-        _bandwidth_state_machine (BandwidthStateMachine): A state machine to manage bandwidth states.
         _read_decode_pipeline (ReadDecodePipeline): The pipeline object for processing the video stream.
     """
 
@@ -66,11 +65,13 @@ class Server:
 
         self._running = False
         self._connection = AutoReconnectServer(host, port)
-        self._socket_reader = SocketDataReader(self._connection, buffer_size=4096)
+        self._bandwidth_monitor = BandwidthMonitor()
+        self._socket_reader = SocketDataReader(self._connection,
+                                               buffer_size=4096,
+                                               bandwidth_monitor=self._bandwidth_monitor)
         self._socket_writer = SocketDataWriter(self._connection)
         self._packet_processor = PacketProcessor(self._socket_reader)
         self._read_decode_pipeline = ReadDecodePipeline(fps, self._packet_processor)
-        self._bandwidth_monitor = BandwidthMonitor()
 
     def run(self) -> None:
         if self._running:
@@ -148,15 +149,11 @@ class Server:
                 video_data, frames = data
                 width = video_data.get_width()
                 height = video_data.get_height()
-                data = video_data.get_data()
 
                 # Update client width and height
                 self._client_width = width
                 self._client_height = height
 
-                # Update minute bandwidth statistics
-                self._bandwidth_monitor.register_received_bytes(len(data))
-
                 # Render only last frame
                 frame = frames[-1]
                 img = pygame.image.frombuffer(frame, (width, height), "RGB")
@@ -180,7 +177,8 @@ class Server:
                 if self._last_image:
                     screen.blit(self._last_image, (self._x_offset, self._y_offset))
             else:
-                # Reset bandwidth monitor
+                # Reset bandwidth monitor together with bytes not reported to it yet
+                self._socket_reader.reset_received_bytes()
                 self._bandwidth_monitor.reset()
 
             # Render FPS, Pipeline FPS and bandwidth